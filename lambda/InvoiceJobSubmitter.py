@@ -1,7 +1,9 @@
 import boto3
+import functools
 import json
-import traceback
+import logging
 import os
+from botocore.config import Config
 from datetime import datetime
 from urllib.parse import unquote_plus
 
@@ -9,23 +11,49 @@ from urllib.parse import unquote_plus
 # CONFIGURATION FROM ENVIRONMENT VARIABLES
 # ===================================================================
 
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 PROJECT_ARN = os.environ.get('PROJECT_ARN')
 S3_BUCKET = os.environ.get('S3_BUCKET')
 OUTPUT_PREFIX = os.environ.get('OUTPUT_PREFIX', 'output/')
 
+# Precomputed once at import - the bucket/prefix part of the output URI is
+# constant, so the per-invocation work is just appending the job suffix
+S3_OUTPUT_PREFIX = f"s3://{S3_BUCKET}/{OUTPUT_PREFIX}"
+
 # ===================================================================
 # AWS CLIENTS
 # ===================================================================
 
-bda_runtime = boto3.client('bedrock-data-automation-runtime', region_name=AWS_REGION)
-sts_client = boto3.client('sts')
+bda_runtime = boto3.client(
+    'bedrock-data-automation-runtime',
+    region_name=AWS_REGION,
+    config=Config(retries={'max_attempts': 2, 'mode': 'standard'}, tcp_keepalive=True)
+)
+
+@functools.lru_cache(maxsize=1)
+def _profile_arn(account_id):
+    """Build the managed data automation profile ARN (AWS-provided, no creation needed)"""
+    return f"arn:aws:bedrock:{AWS_REGION}:{account_id}:data-automation-profile/us.data-automation-v1"
+
+def get_profile_arn(context):
+    """
+    Get the managed data automation profile ARN for this account.
+
+    The account ID is parsed from the invoked function ARN
+    (arn:aws:lambda:region:ACCOUNT:function:name) instead of calling STS,
+    which would add a network round-trip to every cold start. The string
+    is built once and served from the lru_cache afterwards.
 
-# Get AWS Account ID
-AWS_ACCOUNT_ID = sts_client.get_caller_identity()['Account']
+    Args:
+        context: Lambda context object
 
-# Managed Profile ARN (AWS-provided, no creation needed)
-PROFILE_ARN = f"arn:aws:bedrock:{AWS_REGION}:{AWS_ACCOUNT_ID}:data-automation-profile/us.data-automation-v1"
+    Returns:
+        The data automation profile ARN string
+    """
+    return _profile_arn(context.invoked_function_arn.split(':')[4])
 
 def lambda_handler(event, context):
     """
@@ -39,8 +67,11 @@ def lambda_handler(event, context):
         Response dictionary with status and results
     """
     
-    print(f"Received event: {json.dumps(event)}")
-    
+    # Serializing the whole event is debug-only - skip the json.dumps
+    # entirely unless the log level actually requires it
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event))
+
     try:
         # Parse S3 event
         s3_event = event['Records'][0]['s3']
@@ -51,7 +82,7 @@ def lambda_handler(event, context):
         input_s3_uri = f"s3://{bucket}/{key}"
         
         # Step 1: Invoke BDA processing
-        job_info = invoke_bda_processing(input_s3_uri)
+        job_info = invoke_bda_processing(input_s3_uri, get_profile_arn(context))
         
         return {
             'statusCode': 200,
@@ -64,8 +95,7 @@ def lambda_handler(event, context):
         }
         
     except Exception as e:
-        print(f"Error processing invoice: {str(e)}")
-        traceback.print_exc()
+        logger.exception(f"Error processing invoice: {str(e)}")
         
         return {
             'statusCode': 500,
@@ -74,27 +104,27 @@ def lambda_handler(event, context):
             })
         }
         
-def invoke_bda_processing(input_s3_uri):
+def invoke_bda_processing(input_s3_uri, profile_arn):
     """
     Invoke BDA with blueprint
-    
+
     Args:
         input_s3_uri: S3 URI of the invoice to process
-    
+        profile_arn: Managed data automation profile ARN
+
     Returns:
         Dictionary with job_arn and output_s3_uri
     """
-    print(f"Invoking BDA for: {input_s3_uri}")
+    logger.info(f"Invoking BDA for: {input_s3_uri}")
     
     # Generate output location
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    file_name = input_s3_uri.split('/')[-1].split('.')[0]
-    output_key = f"{OUTPUT_PREFIX}{file_name}_{timestamp}/"
-    output_s3_uri = f"s3://{S3_BUCKET}/{output_key}"
+    file_name = os.path.splitext(os.path.basename(input_s3_uri))[0]
+    output_s3_uri = S3_OUTPUT_PREFIX + f"{file_name}_{timestamp}/"
     
     # Invoke BDA with EventBridge notifications enabled
     response = bda_runtime.invoke_data_automation_async(
-        dataAutomationProfileArn=PROFILE_ARN,
+        dataAutomationProfileArn=profile_arn,
         inputConfiguration={
             's3Uri': input_s3_uri
         },
@@ -113,8 +143,8 @@ def invoke_bda_processing(input_s3_uri):
     )
     
     job_arn = response['invocationArn']
-    print(f"BDA job started: {job_arn}")
-    print(f"Output location: {output_s3_uri}")
+    logger.info(f"BDA job started: {job_arn}")
+    logger.info(f"Output location: {output_s3_uri}")
     
     return {
         'job_arn': job_arn,
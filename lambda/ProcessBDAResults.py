@@ -1,7 +1,15 @@
 import boto3
+import functools
+import ijson
 import json
-import traceback
+import logging
+import orjson
+import time
 import os
+import uuid
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
 from urllib.parse import urlparse
@@ -10,6 +18,13 @@ from urllib.parse import urlparse
 # CONFIGURATION FROM ENVIRONMENT VARIABLES
 # ===================================================================
 
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+def _compact_dumps(obj):
+    """Compact JSON encoding for outbound payloads (orjson; Decimals stay numeric via default=float)"""
+    return orjson.dumps(obj, default=float).decode()
+
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 DYNAMODB_TABLE = os.environ.get('DYNAMODB_TABLE', 'invoices')
 CONFIDENCE_THRESHOLD = float(os.environ.get('CONFIDENCE_THRESHOLD', '0.70'))
@@ -19,12 +34,84 @@ A2I_FLOW_ARN = os.environ.get('A2I_FLOW_ARN', '')  # Optional - for future A2I i
 # AWS CLIENTS
 # ===================================================================
 
-s3_client = boto3.client('s3', region_name=AWS_REGION)
-dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
-sagemaker_a2i = boto3.client('sagemaker-a2i-runtime', region_name=AWS_REGION)
+# Constructed lazily on first use - each boto3 client adds ~100-300ms of
+# construction time, so deferring them keeps cold starts from paying for
+# clients the invocation never touches
+
+@functools.lru_cache(maxsize=1)
+def _s3():
+    # Sized for concurrent S3 work (speculative GET + listing, batched
+    # events); keepalive avoids repeated TLS handshakes on warm invocations
+    return boto3.client(
+        's3',
+        region_name=AWS_REGION,
+        config=Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries={'max_attempts': 3, 'mode': 'adaptive'}
+        )
+    )
+
+@functools.lru_cache(maxsize=1)
+def _a2i():
+    return boto3.client('sagemaker-a2i-runtime', region_name=AWS_REGION)
+
+@functools.lru_cache(maxsize=1)
+def _table():
+    return boto3.resource('dynamodb', region_name=AWS_REGION).Table(DYNAMODB_TABLE)
+
+# Invoice field schema: (canonical name, BDA field name, default value).
+# A module-level tuple so the extraction loop doesn't rebuild a
+# list-of-tuples on every invocation.
+_INVOICE_FIELDS = (
+    ('invoice_number', 'Invoice number', None),
+    ('vendor_name', 'VendorSupplier name', None),
+    ('total_amount', 'Total amount due', None),
+    ('tax_amount', 'Tax amount', None),
+    ('subtotal', 'Subtotal', None),
+    ('invoice_date', 'Invoice date', None),
+    ('due_date', 'Due date', None),
+    ('currency', 'Currency', 'USD'),
+)
+
+@functools.lru_cache(maxsize=128)
+def _parse_s3_uri(uri):
+    """
+    Parse an s3:// URI into (bucket, key).
 
-# DynamoDB table
-table = dynamodb.Table(DYNAMODB_TABLE)
+    Cached because the same URI gets parsed in multiple places within an
+    invocation, and it keeps all S3 URI handling (including URL-encoded
+    keys) on one code path.
+    """
+    parsed = urlparse(uri)
+    return parsed.netloc, parsed.path.lstrip('/')
+
+def _get_field(extraction_data, field_name, default_value=None):
+    """
+    Safely extract one field's value and confidence from BDA output.
+
+    Floats are converted to Decimal here, at construction time, so the
+    items are DynamoDB-ready without a recursive conversion pass later.
+    Defined at module scope so the function object isn't recreated as a
+    closure on every invocation.
+
+    Args:
+        extraction_data: Field-level dict from explainability_info[0]
+        field_name: BDA field name to look up
+        default_value: Value to use when the field is missing
+
+    Returns:
+        Dictionary with value, confidence and success
+    """
+    field_data = extraction_data.get(field_name, {})
+    value = field_data.get('value', default_value)
+    if isinstance(value, float):
+        value = Decimal(str(value))
+    return {
+        'value': value,
+        'confidence': Decimal(str(field_data.get('confidence', 0.0))),
+        'success': field_data.get('success', False)
+    }
 
 def lambda_handler(event, context):
     """
@@ -64,73 +151,34 @@ def lambda_handler(event, context):
         Response dictionary with status and results
     """
     
-    print(f"Received EventBridge event: {json.dumps(event)}")
-    
+    # Serializing the whole event is debug-only - skip the json.dumps
+    # entirely unless the log level actually requires it
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received EventBridge event: %s", json.dumps(event))
+
+    # SQS-buffered EventBridge events arrive as a Records batch; direct
+    # EventBridge invocations carry the detail at top level. The batch
+    # path returns a partial batch response so SQS only redelivers the
+    # records that actually failed (requires ReportBatchItemFailures on
+    # the event source mapping). It deliberately sits outside the
+    # catch-all below: a 500 body without a raise reads as success to
+    # SQS and would delete the whole batch, so unexpected errors here
+    # must propagate.
+    if 'Records' in event:
+        return {
+            'batchItemFailures': process_sqs_batch(event['Records'])
+        }
+
     try:
-        # Extract BDA job details from EventBridge event
-        detail = event['detail']
-        job_id = detail['job_id']
-        job_status = detail['job_status']
-        
-        # Construct S3 URIs from bucket + name
-        input_s3_bucket = detail['input_s3_object']['s3_bucket']
-        input_s3_name = detail['input_s3_object']['name']
-        input_s3_uri = f"s3://{input_s3_bucket}/{input_s3_name}"
-        
-        output_s3_bucket = detail['output_s3_location']['s3_bucket']
-        output_s3_name = detail['output_s3_location']['name']
-        output_s3_uri = f"s3://{output_s3_bucket}/{output_s3_name}/"
-        
-        print(f"Processing BDA job: {job_id}")
-        print(f"Job status: {job_status}")
-        print(f"Input location: {input_s3_uri}")
-        print(f"Output location: {output_s3_uri}")
-        
-        # Step 1: Read BDA output from S3
-        bda_results = read_bda_output_from_s3(output_s3_uri)
-        
-        # Step 2: Extract invoice data and calculate confidence
-        invoice_data = extract_invoice_data(bda_results, input_s3_uri, output_s3_uri, job_id)
-        
-        # Step 3: Calculate average confidence
-        avg_confidence = invoice_data['average_confidence']
-        
-        print(f"Average confidence: {avg_confidence:.2%}")
-        print(f"Threshold: {CONFIDENCE_THRESHOLD:.2%}")
-        
-        # Step 4: Route based on confidence
-        if avg_confidence >= CONFIDENCE_THRESHOLD:
-            # High confidence - Store directly in DynamoDB
-            store_in_dynamodb(invoice_data)
-            
-            return {
-                'statusCode': 200,
-                'body': json.dumps({
-                    'message': 'Invoice stored in DynamoDB',
-                    'invoice_id': invoice_data['invoice_id'],
-                    'confidence': avg_confidence,
-                    'action': 'stored_in_dynamodb'
-                })
-            }
-        else:
-            # Low confidence - Route to A2I for human review
-            review_result = send_to_a2i_review(invoice_data, bda_results)
-            
-            return {
-                'statusCode': 200,
-                'body': json.dumps({
-                    'message': 'Invoice sent to A2I for human review',
-                    'invoice_id': invoice_data['invoice_id'],
-                    'confidence': avg_confidence,
-                    'action': 'sent_to_a2i',
-                    'a2i_result': review_result
-                })
-            }
-        
+        result = process_bda_event(event['detail'])
+        return {
+            'statusCode': 200,
+            'body': json.dumps(result)
+        }
+
     except Exception as e:
-        print(f"Error processing BDA results: {str(e)}")
-        traceback.print_exc()
-        
+        logger.exception(f"Error processing BDA results: {str(e)}")
+
         return {
             'statusCode': 500,
             'body': json.dumps({
@@ -138,6 +186,164 @@ def lambda_handler(event, context):
             })
         }
 
+def process_sqs_batch(records):
+    """
+    Process a batch of SQS-buffered EventBridge events in one invocation
+
+    S3 reads dominate wall time (~100ms each) and are I/O bound, so they
+    are fanned out over a thread pool (boto3 clients are thread-safe).
+    Extraction runs in the main thread and high-confidence invoices are
+    accumulated and flushed to DynamoDB in a single batched write.
+
+    Each record is isolated: a failure in one record's read or processing
+    is reported back to SQS for redelivery without aborting the rest of
+    the batch.
+
+    Args:
+        records: List of SQS records whose bodies are EventBridge events
+
+    Returns:
+        List of batchItemFailures entries for the records that failed
+    """
+    logger.info(f"Processing batch of {len(records)} BDA events")
+
+    failures = []
+
+    # Decode each record body individually - a malformed body fails only
+    # its own record, not the batch
+    parsed = []
+    for record in records:
+        try:
+            parsed.append((record, orjson.loads(record['body'])['detail']))
+        except Exception as e:
+            logger.exception(f"Error decoding SQS record {record.get('messageId')}: {str(e)}")
+            failures.append({'itemIdentifier': record['messageId']})
+
+    # Only prefetch output for successful jobs - failed ones are skipped
+    # by process_bda_event without touching S3. The worker builds the URI
+    # too, so a malformed detail surfaces at future.result() inside the
+    # per-record try below.
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [
+            executor.submit(_read_job_output, detail)
+            if detail.get('job_status') == 'SUCCESS' else None
+            for _, detail in parsed
+        ]
+
+        pending_store = []
+        pending_message_ids = []
+
+        for (record, detail), future in zip(parsed, futures):
+            try:
+                bda_results = future.result() if future else None
+                stored_before = len(pending_store)
+                process_bda_event(detail, bda_results, pending_store)
+                if len(pending_store) > stored_before:
+                    pending_message_ids.append(record['messageId'])
+            except Exception as e:
+                logger.exception(f"Error processing BDA job {detail.get('job_id')}: {str(e)}")
+                failures.append({'itemIdentifier': record['messageId']})
+
+    if pending_store:
+        try:
+            store_in_dynamodb(pending_store)
+        except Exception as e:
+            logger.exception(f"Error flushing batched invoices to DynamoDB: {str(e)}")
+            failures.extend({'itemIdentifier': message_id} for message_id in pending_message_ids)
+
+    logger.info(f"Batch complete: {len(records) - len(failures)} succeeded, {len(failures)} failed")
+    return failures
+
+def _output_s3_uri(detail):
+    """Build the BDA output folder S3 URI from an event detail"""
+    output_s3_location = detail['output_s3_location']
+    return f"s3://{output_s3_location['s3_bucket']}/{output_s3_location['name']}/"
+
+def _read_job_output(detail):
+    """Read one job's BDA output from S3 (thread-pool worker for the batch path)"""
+    return read_bda_output_from_s3(_output_s3_uri(detail))
+
+def process_bda_event(detail, bda_results=None, pending_store=None):
+    """
+    Process one BDA job-completion event: read output, extract, route
+
+    Args:
+        detail: EventBridge event detail with job metadata
+        bda_results: Pre-fetched BDA output (the batch path overlaps the
+            S3 reads); fetched here when None
+        pending_store: When given, high-confidence invoices are appended
+            to this list for a single batched DynamoDB write by the
+            caller instead of being stored immediately
+
+    Returns:
+        Result dictionary describing the action taken
+    """
+    job_id = detail['job_id']
+    job_status = detail['job_status']
+
+    # Fail fast on unsuccessful jobs - there is no output to read, so the
+    # S3 GET would be a guaranteed miss
+    if job_status != 'SUCCESS':
+        logger.warning(f"BDA job {job_id} did not succeed (status: {job_status}), skipping")
+        return {
+            'message': 'BDA job did not succeed',
+            'job_id': job_id,
+            'job_status': job_status,
+            'action': 'skipped'
+        }
+
+    # Construct S3 URIs from bucket + name
+    input_s3_bucket = detail['input_s3_object']['s3_bucket']
+    input_s3_name = detail['input_s3_object']['name']
+    input_s3_uri = f"s3://{input_s3_bucket}/{input_s3_name}"
+
+    output_s3_uri = _output_s3_uri(detail)
+
+    logger.info(f"Processing BDA job: {job_id}")
+    logger.info(f"Job status: {job_status}")
+    logger.info(f"Input location: {input_s3_uri}")
+    logger.info(f"Output location: {output_s3_uri}")
+
+    # Step 1: Read BDA output from S3
+    if bda_results is None:
+        bda_results = read_bda_output_from_s3(output_s3_uri)
+
+    # Step 2: Extract invoice data and calculate confidence
+    invoice_data = extract_invoice_data(bda_results, input_s3_uri, output_s3_uri, job_id)
+
+    # Step 3: Calculate average confidence
+    avg_confidence = invoice_data['average_confidence']
+
+    logger.info(f"Average confidence: {avg_confidence:.2%}")
+    logger.info(f"Threshold: {CONFIDENCE_THRESHOLD:.2%}")
+
+    # Step 4: Route based on confidence
+    if avg_confidence >= CONFIDENCE_THRESHOLD:
+        # High confidence - Store directly in DynamoDB (or defer to the
+        # caller's batched write)
+        if pending_store is not None:
+            pending_store.append(invoice_data)
+        else:
+            store_in_dynamodb(invoice_data)
+
+        return {
+            'message': 'Invoice stored in DynamoDB',
+            'invoice_id': invoice_data['invoice_id'],
+            'confidence': float(avg_confidence),
+            'action': 'stored_in_dynamodb'
+        }
+    else:
+        # Low confidence - Route to A2I for human review
+        review_result = send_to_a2i_review(invoice_data, bda_results)
+
+        return {
+            'message': 'Invoice sent to A2I for human review',
+            'invoice_id': invoice_data['invoice_id'],
+            'confidence': float(avg_confidence),
+            'action': 'sent_to_a2i',
+            'a2i_result': review_result
+        }
+
 def read_bda_output_from_s3(output_s3_uri):
     """
     Read BDA output JSON from S3
@@ -150,37 +356,51 @@ def read_bda_output_from_s3(output_s3_uri):
     Returns:
         Dictionary with BDA extraction results
     """
-    print(f"Reading BDA output from: {output_s3_uri}")
+    logger.info(f"Reading BDA output from: {output_s3_uri}")
     
     # Parse S3 URI
-    parsed = urlparse(output_s3_uri)
-    bucket = parsed.netloc
-    prefix = parsed.path.lstrip('/')
-    
-    # BDA outputs to custom_output/0/result.json within the job output folder
-    # Pattern: s3://bucket/output/filename_timestamp/job_id/0/custom_output/0/result.json
+    bucket, prefix = _parse_s3_uri(output_s3_uri)
+
+    # BDA usually outputs to custom_output/0/result.json within the job output
+    # folder, but the prefix layout can vary (e.g. nested job_id/0/...).
+    # Try the expected key directly - the happy path is a single GET - and
+    # only on NoSuchKey fall back to a list_objects_v2 on the prefix to
+    # locate result.json without a retry cycle.
     if not prefix.endswith('/'):
         prefix = prefix + '/'
-    output_key = f"{prefix}custom_output/0/result.json"
-    
-    # Handle leading slash
-    if output_key.startswith('/'):
-        output_key = output_key.lstrip('/')
-    
-    print(f"S3 Bucket: {bucket}, Key: {output_key}")
-    
+    expected_key = f"{prefix}custom_output/0/result.json"
+
+    logger.info(f"S3 Bucket: {bucket}, Key: {expected_key}")
+
+    s3_client = _s3()
     try:
-        response = s3_client.get_object(Bucket=bucket, Key=output_key)
-        bda_output = json.loads(response['Body'].read().decode('utf-8'))
-        
-        print(f"Successfully read BDA output: {len(json.dumps(bda_output))} bytes")
-        return bda_output
-        
-    except s3_client.exceptions.NoSuchKey:
-        print(f"ERROR: Output file not found at s3://{bucket}/{output_key}")
-        raise Exception(f"BDA output file not found: s3://{bucket}/{output_key}")
+        try:
+            response = s3_client.get_object(Bucket=bucket, Key=expected_key)
+        except s3_client.exceptions.NoSuchKey:
+            listing = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix, MaxKeys=50)
+            result_keys = [obj['Key'] for obj in listing.get('Contents', [])
+                           if obj['Key'].endswith('result.json')]
+            if not result_keys:
+                logger.error(f"ERROR: No result.json found under s3://{bucket}/{prefix}")
+                raise Exception(f"BDA output file not found under: s3://{bucket}/{prefix}")
+            logger.info(f"Expected key missing, found result at: {result_keys[0]}")
+            response = s3_client.get_object(Bucket=bucket, Key=result_keys[0])
+
+        # Stream-parse only the explainability_info subtree instead of
+        # json.loads on the whole blob - BDA results carry large sections
+        # (inference_result, geometry) that downstream code never reads.
+        # ijson consumes the StreamingBody incrementally, keeping memory
+        # bounded regardless of result size.
+        fields = next(
+            ijson.items(response['Body'], 'explainability_info.item', use_float=True),
+            {}
+        )
+
+        logger.info(f"Successfully read BDA output: {response['ContentLength']} bytes")
+        return {'explainability_info': [fields]}
+
     except Exception as e:
-        print(f"ERROR reading S3 object: {str(e)}")
+        logger.error(f"ERROR reading S3 object: {str(e)}")
         raise
 
 def extract_invoice_data(bda_results, input_s3_uri, output_s3_uri, job_id):
@@ -217,69 +437,47 @@ def extract_invoice_data(bda_results, input_s3_uri, output_s3_uri, job_id):
     Returns:
         Dictionary with extracted invoice data and confidence scores
     """
-    print("Extracting invoice data from BDA results...")
+    logger.info("Extracting invoice data from BDA results...")
     
     # BDA result structure: explainability_info[0] contains field-level data
     extraction_data = bda_results.get('explainability_info', [{}])[0]
-    
-    # Helper function to safely extract field value and confidence
-    def get_field(field_name, default_value=None):
-        field_data = extraction_data.get(field_name, {})
-        return {
-            'value': field_data.get('value', default_value),
-            'confidence': field_data.get('confidence', 0.0),
-            'success': field_data.get('success', False)
-        }
-    
-    # Extract key invoice fields
-    invoice_number = get_field('Invoice number')
-    vendor_name = get_field('VendorSupplier name')
-    total_amount = get_field('Total amount due')
-    tax_amount = get_field('Tax amount')
-    subtotal = get_field('Subtotal')
-    invoice_date = get_field('Invoice date')
-    due_date = get_field('Due date')
-    currency = get_field('Currency', 'USD')
-    
-    # Collect all confidence scores for fields that were successfully extracted
-    confidence_scores = []
+
+    # Extract all key invoice fields and accumulate confidence for the
+    # successfully extracted ones in a single pass
+    fields = {}
     field_confidences = {}
-    
-    for field_name, field_data in [
-        ('invoice_number', invoice_number),
-        ('vendor_name', vendor_name),
-        ('total_amount', total_amount),
-        ('tax_amount', tax_amount),
-        ('subtotal', subtotal),
-        ('invoice_date', invoice_date),
-        ('due_date', due_date),
-        ('currency', currency)
-    ]:
+    confidence_sum = Decimal('0')
+    confidence_count = 0
+
+    for field_name, bda_key, default in _INVOICE_FIELDS:
+        field_data = _get_field(extraction_data, bda_key, default)
+        fields[field_name] = field_data
         if field_data['success'] and field_data['value'] is not None:
-            confidence_scores.append(field_data['confidence'])
+            confidence_sum += field_data['confidence']
+            confidence_count += 1
             field_confidences[field_name] = field_data['confidence']
-    
-    # Calculate average confidence
-    avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.0
+
+    # Calculate average confidence (Decimal arithmetic, DynamoDB-ready)
+    avg_confidence = confidence_sum / confidence_count if confidence_count else Decimal('0')
     
     # Generate invoice_id (use BDA's invoice number or generate from filename)
-    invoice_id = invoice_number['value']
+    invoice_id = fields['invoice_number']['value']
     if not invoice_id:
         # Fallback: use input filename
-        filename = input_s3_uri.split('/')[-1].split('.')[0]
+        filename = os.path.splitext(os.path.basename(_parse_s3_uri(input_s3_uri)[1]))[0]
         timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
         invoice_id = f"{filename}_{timestamp}"
     
     # Construct invoice data dictionary
     invoice_data = {
         'invoice_id': invoice_id,
-        'vendor_name': vendor_name['value'],
-        'total_amount': total_amount['value'],
-        'tax_amount': tax_amount['value'],
-        'subtotal': subtotal['value'],
-        'invoice_date': invoice_date['value'],
-        'due_date': due_date['value'],
-        'currency': currency['value'],
+        'vendor_name': fields['vendor_name']['value'],
+        'total_amount': fields['total_amount']['value'],
+        'tax_amount': fields['tax_amount']['value'],
+        'subtotal': fields['subtotal']['value'],
+        'invoice_date': fields['invoice_date']['value'],
+        'due_date': fields['due_date']['value'],
+        'currency': fields['currency']['value'],
         'average_confidence': avg_confidence,
         'field_confidences': field_confidences,
         'input_s3_uri': input_s3_uri,
@@ -289,42 +487,71 @@ def extract_invoice_data(bda_results, input_s3_uri, output_s3_uri, job_id):
         'status': 'high_confidence' if avg_confidence >= CONFIDENCE_THRESHOLD else 'needs_review'
     }
     
-    print(f"Extracted invoice: {invoice_id}")
-    print(f"Vendor: {vendor_name['value']}")
-    print(f"Total: {total_amount['value']} {currency['value']}")
-    print(f"Average confidence: {avg_confidence:.2%}")
+    logger.info(f"Extracted invoice: {invoice_id}")
+    logger.info(f"Vendor: {invoice_data['vendor_name']}")
+    logger.info(f"Total: {invoice_data['total_amount']} {invoice_data['currency']}")
+    logger.info(f"Average confidence: {avg_confidence:.2%}")
     
     return invoice_data
 
 def store_in_dynamodb(invoice_data):
     """
     Store invoice data in DynamoDB
-    
+
+    Accepts a single invoice or a list of invoices. Lists are written
+    through table.batch_writer, which packs up to 25 PutRequests per
+    BatchWriteItem call and resubmits UnprocessedItems internally -
+    cutting the RPC count by up to 25x when events arrive batched
+    (e.g. EventBridge buffered through SQS).
+
     Args:
-        invoice_data: Dictionary with invoice fields
+        invoice_data: Dictionary with invoice fields, or a list of them
     """
-    print(f"Storing invoice {invoice_data['invoice_id']} in DynamoDB...")
-    
-    # Convert float to Decimal for DynamoDB
-    def convert_floats(obj):
-        if isinstance(obj, float):
-            return Decimal(str(obj))
-        elif isinstance(obj, dict):
-            return {k: convert_floats(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [convert_floats(item) for item in obj]
-        return obj
-    
-    # Prepare item for DynamoDB
-    item = convert_floats(invoice_data)
-    
-    try:
-        table.put_item(Item=item)
-        print(f"Successfully stored invoice {invoice_data['invoice_id']} in DynamoDB")
-        
-    except Exception as e:
-        print(f"ERROR storing in DynamoDB: {str(e)}")
-        raise
+    items = invoice_data if isinstance(invoice_data, list) else [invoice_data]
+    logger.info(f"Storing {len(items)} invoice(s) in DynamoDB...")
+
+    table = _table()
+
+    # Retry throttled writes with exponential backoff
+    for attempt in range(5):
+        try:
+            if len(items) == 1:
+                table.put_item(Item=items[0])
+            else:
+                with table.batch_writer(overwrite_by_pkeys=['invoice_id']) as batch:
+                    for item in items:
+                        batch.put_item(Item=item)
+            logger.info(f"Successfully stored {len(items)} invoice(s) in DynamoDB")
+            return
+
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code in ('ProvisionedThroughputExceededException', 'ThrottlingException') and attempt < 4:
+                logger.warning(f"DynamoDB throttled (attempt {attempt + 1}), backing off...")
+                time.sleep(2 ** attempt * 0.05)
+            else:
+                logger.error(f"ERROR storing in DynamoDB: {str(e)}")
+                raise
+        except Exception as e:
+            logger.error(f"ERROR storing in DynamoDB: {str(e)}")
+            raise
+
+def _build_human_loop_input(invoice_data):
+    """Prepare the input payload shown to human reviewers"""
+    return {
+        'invoice_id': invoice_data['invoice_id'],
+        'vendor_name': invoice_data['vendor_name'],
+        'total_amount': invoice_data['total_amount'],
+        'tax_amount': invoice_data['tax_amount'],
+        'subtotal': invoice_data['subtotal'],
+        'invoice_date': invoice_data['invoice_date'],
+        'due_date': invoice_data['due_date'],
+        'currency': invoice_data['currency'],
+        'average_confidence': invoice_data['average_confidence'],
+        'field_confidences': invoice_data['field_confidences'],
+        'input_s3_uri': invoice_data['input_s3_uri'],
+        'output_s3_uri': invoice_data['output_s3_uri']
+    }
 
 def send_to_a2i_review(invoice_data, bda_results):
     """
@@ -339,12 +566,12 @@ def send_to_a2i_review(invoice_data, bda_results):
     Returns:
         Dictionary with A2I submission result
     """
-    print(f"Preparing invoice {invoice_data['invoice_id']} for A2I human review...")
-    print(f"Average confidence: {invoice_data['average_confidence']:.2%} (below threshold: {CONFIDENCE_THRESHOLD:.2%})")
+    logger.info(f"Preparing invoice {invoice_data['invoice_id']} for A2I human review...")
+    logger.info(f"Average confidence: {invoice_data['average_confidence']:.2%} (below threshold: {CONFIDENCE_THRESHOLD:.2%})")
     
     # Check if A2I Flow ARN is configured
     if not A2I_FLOW_ARN:
-        print("WARNING: A2I_FLOW_ARN not configured. Storing in DynamoDB with 'needs_review' status.")
+        logger.warning("WARNING: A2I_FLOW_ARN not configured. Storing in DynamoDB with 'needs_review' status.")
         
         # Store in DynamoDB with needs_review status for manual processing
         invoice_data['status'] = 'needs_review'
@@ -359,36 +586,21 @@ def send_to_a2i_review(invoice_data, bda_results):
     
     # A2I is configured - create human loop
     try:
-        # Prepare input for human reviewers
-        human_loop_input = {
-            'invoice_id': invoice_data['invoice_id'],
-            'vendor_name': invoice_data['vendor_name'],
-            'total_amount': invoice_data['total_amount'],
-            'tax_amount': invoice_data['tax_amount'],
-            'subtotal': invoice_data['subtotal'],
-            'invoice_date': invoice_data['invoice_date'],
-            'due_date': invoice_data['due_date'],
-            'currency': invoice_data['currency'],
-            'average_confidence': invoice_data['average_confidence'],
-            'field_confidences': invoice_data['field_confidences'],
-            'input_s3_uri': invoice_data['input_s3_uri'],
-            'output_s3_uri': invoice_data['output_s3_uri']
-        }
-        
-        # Generate unique human loop name
-        human_loop_name = f"invoice-review-{invoice_data['invoice_id']}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        # Generate unique human loop name - a uuid suffix is collision-safe
+        # under concurrent invocations, unlike a second-resolution timestamp
+        human_loop_name = f"invoice-review-{invoice_data['invoice_id']}-{uuid.uuid4().hex[:12]}"
         
         # Start human loop
-        response = sagemaker_a2i.start_human_loop(
+        response = _a2i().start_human_loop(
             HumanLoopName=human_loop_name,
             FlowDefinitionArn=A2I_FLOW_ARN,
             HumanLoopInput={
-                'InputContent': json.dumps(human_loop_input)
+                'InputContent': _compact_dumps(_build_human_loop_input(invoice_data))
             }
         )
         
-        print(f"Successfully created A2I human loop: {human_loop_name}")
-        print(f"Human loop ARN: {response['HumanLoopArn']}")
+        logger.info(f"Successfully created A2I human loop: {human_loop_name}")
+        logger.info(f"Human loop ARN: {response['HumanLoopArn']}")
         
         # Store in DynamoDB with pending_review status
         invoice_data['status'] = 'pending_review'
@@ -404,8 +616,7 @@ def send_to_a2i_review(invoice_data, bda_results):
         }
         
     except Exception as e:
-        print(f"ERROR creating A2I human loop: {str(e)}")
-        traceback.print_exc()
+        logger.exception(f"ERROR creating A2I human loop: {str(e)}")
         
         # Fallback: Store in DynamoDB with error status
         invoice_data['status'] = 'a2i_error'